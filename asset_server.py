@@ -0,0 +1,89 @@
+"""Serve the built screenshots with long-lived cache headers.
+
+Streamlit's own static route (``/app/static/...``) sends an ETag but no
+Cache-Control, so browsers still revalidate every image on every visit. Asset
+names in ``static/manual/`` contain the source's content hash and never change
+meaning, so this server marks them immutable for a year, with a strong ETag
+for any client that revalidates anyway:
+
+    python image_assets.py                     # build the assets
+    python asset_server.py --port 8502 &
+    MANUAL_IMAGE_MODE=static MANUAL_ASSET_URL=http://localhost:8502 streamlit run manualapp.py
+
+Behind a reverse proxy the same headers can be set on ``/app/static/manual/``
+instead, see ``deploy/nginx.conf``.
+"""
+import argparse
+import functools
+import hashlib
+import os
+from http import HTTPStatus
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+import image_assets
+
+CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+_etags = {}
+
+
+def etag(path):
+    """Strong ETag from the file's content, recomputed only when it changes."""
+    stat = os.stat(path)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cached = _etags.get(path)
+    if cached is None or cached[0] != stamp:
+        with open(path, "rb") as f:
+            cached = (stamp, '"%s"' % hashlib.sha256(f.read()).hexdigest()[:32])
+        _etags[path] = cached
+    return cached[1]
+
+
+class AssetHandler(SimpleHTTPRequestHandler):
+    extensions_map = {**SimpleHTTPRequestHandler.extensions_map, ".webp": "image/webp"}
+
+    def send_head(self):
+        path = self.translate_path(self.path)
+        if not os.path.isfile(path):
+            self.send_error(HTTPStatus.NOT_FOUND, "File not found")
+            return None
+        tag = etag(path)
+        if tag in self.headers.get("If-None-Match", ""):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header("ETag", tag)
+            self.send_header("Cache-Control", CACHE_CONTROL)
+            self.end_headers()
+            return None
+        f = open(path, "rb")
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", self.guess_type(path))
+        self.send_header("Content-Length", str(os.fstat(f.fileno()).st_size))
+        self.send_header("ETag", tag)
+        self.send_header("Cache-Control", CACHE_CONTROL)
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.end_headers()
+        return f
+
+    def list_directory(self, path):
+        self.send_error(HTTPStatus.NOT_FOUND, "File not found")
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve manual screenshots with immutable cache headers.")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8502)
+    parser.add_argument("--directory", default=image_assets.BUILD_DIR)
+    args = parser.parse_args()
+
+    handler = functools.partial(AssetHandler, directory=args.directory)
+    server = ThreadingHTTPServer((args.host, args.port), handler)
+    print(f"serving {args.directory} on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+"""Headless navigation benchmark for manualapp.py.
+
+Drives the app through Streamlit's AppTest harness (no browser, no network)
+and measures:
+
+* cold start - a fresh interpreter importing Streamlit and running the app
+  once, up to the welcome screen,
+* rerun latency for every sidebar navigation button, plus the "For Students"
+  page with every step's screenshots opened,
+* peak Python memory (tracemalloc) and max RSS of the navigation run.
+
+Results are compared against ``benchmarks/baseline.json``; the run fails when
+any metric is worse than its baseline by more than the threshold.
+
+    python benchmarks/bench_navigation.py                   # compare
+    python benchmarks/bench_navigation.py --update-baseline # record new baseline
+
+Baselines are machine specific: record one on the machine that runs the check.
+"""
+import argparse
+import json
+import logging
+import os
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(HERE)
+APP = os.path.join(REPO_ROOT, "manualapp.py")
+BASELINE = os.path.join(HERE, "baseline.json")
+sys.path.insert(0, REPO_ROOT)
+
+# Sidebar buttons, in the order a reader would click them.
+NAVIGATION_KEYS = [
+    "install_General Requirement_btn",
+    "install_requiredlibraries_btn",
+    "manual_For Students",
+    "manual_For Admins",
+]
+
+# Regressions smaller than these absolute amounts are treated as noise.
+MIN_SLACK = {"_ms": 10.0, "_mib": 1.0}
+
+
+def _app_test():
+    from streamlit.testing.v1 import AppTest
+
+    # Setting widget state from the benchmark thread makes Streamlit warn about
+    # a missing script context; Streamlit resets logger levels, so filter it
+    logging.getLogger("streamlit.runtime.scriptrunner_utils.script_run_context").addFilter(
+        lambda record: "missing ScriptRunContext" not in record.getMessage())
+
+    return AppTest.from_file(APP, default_timeout=60)
+
+
+def _check(at, step):
+    if at.exception:
+        raise RuntimeError(f"{step}: app raised {at.exception[0].value}")
+
+
+def cold_start_child():
+    """Runs in a fresh interpreter: time from first import to first paint."""
+    start = time.perf_counter()
+    at = _app_test().run()
+    _check(at, "cold start")
+    print(json.dumps({"cold_start_ms": (time.perf_counter() - start) * 1000}))
+
+
+def measure_cold_start(repeat):
+    samples = []
+    for _ in range(repeat):
+        out = subprocess.run(
+            [sys.executable, __file__, "--cold-start-child"],
+            cwd=REPO_ROOT, capture_output=True, text=True, check=True,
+        ).stdout
+        samples.append(json.loads(out.strip().splitlines()[-1])["cold_start_ms"])
+    return min(samples)
+
+
+def measure_navigation(repeat):
+    """Fastest rerun latency per navigation path, in milliseconds."""
+    import manual_content
+
+    step_keys = [f"step_{block.key}"
+                 for block in manual_content.build_page("User Manual", "For Students")
+                 if block.kind == "section" and block.has_images]
+    at = _app_test().run()
+    _check(at, "first run")
+    samples = {key: [] for key in NAVIGATION_KEYS}
+    samples["students_all_steps_open"] = []
+
+    # One untimed pass first: the first visit to each page builds its missing
+    # screenshot assets and parses its content, a one-off cost per process
+    # that says nothing about rerun latency
+    for i in range(repeat + 1):
+        if i == 1:
+            samples = {key: [] for key in samples}
+        for key in NAVIGATION_KEYS:
+            start = time.perf_counter()
+            at.button(key=key).click().run()
+            samples[key].append((time.perf_counter() - start) * 1000)
+            _check(at, key)
+
+        # Every step of the students page expanded, i.e. all full screenshots
+        at.button(key="manual_For Students").click().run()
+        for key in step_keys:
+            at.session_state[key] = True
+        start = time.perf_counter()
+        at.run()
+        samples["students_all_steps_open"].append((time.perf_counter() - start) * 1000)
+        _check(at, "students_all_steps_open")
+        for key in step_keys:
+            at.session_state[key] = False
+
+    # The minimum is what the code costs; everything above it is scheduler and
+    # machine noise, which made medians of ~30 ms reruns swing by half
+    return {key: min(values) for key, values in samples.items()}
+
+
+def run(repeat):
+    os.chdir(REPO_ROOT)
+    results = {"cold_start_ms": measure_cold_start(repeat)}
+    navigation = measure_navigation(repeat)
+    results.update({f"rerun_ms[{key}]": ms for key, ms in navigation.items()})
+
+    # Separate pass for memory: tracing slows everything down, so it must not
+    # overlap with the timed runs
+    tracemalloc.start()
+    measure_navigation(1)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    results["peak_traced_mib"] = peak / 2**20
+    results["max_rss_mib"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    return {key: round(value, 2) for key, value in results.items()}
+
+
+def compare(results, baseline, threshold):
+    """Return a list of human-readable regressions."""
+    regressions = []
+    for key, value in results.items():
+        base = baseline.get(key)
+        if base is None:
+            continue
+        limit = base * (1 + threshold)
+        for suffix, slack in MIN_SLACK.items():
+            if key.split("[")[0].endswith(suffix):
+                limit = max(limit, base + slack)
+        if value > limit:
+            regressions.append(f"{key}: {value} > {round(limit, 2)} (baseline {base})")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=7, help="samples per metric (the fastest is kept)")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="allowed regression over baseline, as a fraction (default 0.25)")
+    parser.add_argument("--update-baseline", action="store_true", help="write results as the new baseline")
+    parser.add_argument("--cold-start-child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.cold_start_child:
+        cold_start_child()
+        return 0
+
+    results = run(args.repeat)
+    width = max(len(key) for key in results)
+    baseline = {}
+    if os.path.exists(BASELINE):
+        with open(BASELINE, encoding="utf-8") as f:
+            baseline = json.load(f)
+    for key, value in results.items():
+        base = baseline.get(key)
+        print(f"{key:<{width}}  {value:>10.2f}" + (f"  (baseline {base})" if base is not None else ""))
+
+    if args.update_baseline:
+        with open(BASELINE, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+            f.write("\n")
+        print(f"baseline written to {os.path.relpath(BASELINE, REPO_ROOT)}")
+        return 0
+
+    if not baseline:
+        print("no baseline yet; run with --update-baseline to record one")
+        return 0
+    regressions = compare(results, baseline, args.threshold)
+    for line in regressions:
+        print(f"REGRESSION {line}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,219 @@
+"""Concurrent-session load generator for the manual app.
+
+Opens many simulated browser sessions over Streamlit's websocket protocol and
+has each of them click through the manual's routes. A "click" is a rerun
+request carrying the route's query string (``?page=...&section=...``), which is
+exactly what the app's URL routing reacts to, so no widget IDs are needed.
+
+    # start a server itself, 200 sessions, 10 clicks each
+    python benchmarks/load_test.py --start-server --sessions 200 --clicks 10
+
+    # or hit something already running (a single app or a load balancer)
+    python benchmarks/load_test.py --url http://localhost:8080 --server-pid 1234 --server-pid 1235
+
+Reports throughput, p50/p99 rerun latency, errors and, when the server
+process(es) are known, resident memory before/after and per open session.
+Needs the ``websockets`` package, which Streamlit's server already pulls in.
+"""
+import argparse
+import asyncio
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+from urllib.parse import urlencode, urlsplit
+
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from websockets.asyncio.client import connect
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(HERE)
+sys.path.insert(0, REPO_ROOT)
+
+import manual_content  # noqa: E402
+
+QUERY_STRINGS = [urlencode({"page": page, "section": section})
+                 for _, _, page, section in manual_content.ROUTES]
+
+
+def rss_kib(pid):
+    """Resident set size of ``pid`` in KiB (Linux)."""
+    with open(f"/proc/{pid}/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+    return 0
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+class Session:
+    """One simulated browser tab."""
+
+    def __init__(self, url, timeout):
+        parts = urlsplit(url)
+        scheme = "wss" if parts.scheme == "https" else "ws"
+        self.stream_url = f"{scheme}://{parts.netloc}{parts.path.rstrip('/')}/_stcore/stream"
+        self.origin = f"{parts.scheme}://{parts.netloc}"
+        self.timeout = timeout
+        self.ws = None
+
+    async def open(self):
+        self.ws = await connect(self.stream_url, subprotocols=["streamlit"],
+                                additional_headers={"Origin": self.origin},
+                                max_size=None, open_timeout=self.timeout)
+
+    async def rerun(self, query_string):
+        """Request a rerun and wait for the script to finish; returns seconds."""
+        msg = BackMsg()
+        msg.rerun_script.query_string = query_string
+        start = time.perf_counter()
+        await self.ws.send(msg.SerializeToString())
+        while True:
+            data = await asyncio.wait_for(self.ws.recv(), self.timeout)
+            forward = ForwardMsg()
+            forward.ParseFromString(data)
+            if forward.WhichOneof("type") == "script_finished":
+                return time.perf_counter() - start
+
+    async def close(self):
+        if self.ws is not None:
+            await self.ws.close()
+
+
+async def run_session(url, clicks, timeout, latencies, errors, opened, hold, done):
+    session = Session(url, timeout)
+    try:
+        await session.open()
+        # First paint: the landing page, as a fresh visitor would see it
+        latencies.append(await session.rerun(""))
+        opened.append(session)
+        for _ in range(clicks):
+            latencies.append(await session.rerun(random.choice(QUERY_STRINGS)))
+        done.release()
+        await hold.wait()
+    except Exception as exc:  # keep going; report how many sessions failed
+        errors.append(f"{type(exc).__name__}: {exc}")
+        done.release()
+    finally:
+        await session.close()
+
+
+async def warm_up(url, timeout):
+    """Visit every route once so imports and page caches are not counted."""
+    session = Session(url, timeout)
+    await session.open()
+    try:
+        for query_string in [""] + QUERY_STRINGS:
+            await session.rerun(query_string)
+    finally:
+        await session.close()
+
+
+async def run_load(url, sessions, clicks, ramp, timeout, pids):
+    latencies, errors, opened = [], [], []
+    hold = asyncio.Event()
+    # Released once per session, when it has done its clicks or has failed
+    done = asyncio.Semaphore(0)
+    await warm_up(url, timeout)
+    before = sum(rss_kib(pid) for pid in pids)
+    start = time.perf_counter()
+    tasks = []
+    for _ in range(sessions):
+        tasks.append(asyncio.create_task(
+            run_session(url, clicks, timeout, latencies, errors, opened, hold, done)))
+        if ramp:
+            await asyncio.sleep(ramp / sessions)
+
+    # Wait until every session has done its clicks, then measure memory while
+    # they are all still connected
+    for _ in range(sessions):
+        await done.acquire()
+    elapsed = time.perf_counter() - start
+    after = sum(rss_kib(pid) for pid in pids)
+    hold.set()
+    await asyncio.gather(*tasks)
+    return latencies, errors, elapsed, before, after, len(opened)
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_server(port, extra_env):
+    env = dict(os.environ, **extra_env)
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", "manualapp.py",
+         "--server.headless", "true", "--server.port", str(port),
+         "--browser.gatherUsageStats", "false"],
+        cwd=REPO_ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    health = f"http://127.0.0.1:{port}/_stcore/health"
+    for _ in range(300):
+        try:
+            with urllib.request.urlopen(health, timeout=1):
+                return proc
+        except OSError:
+            time.sleep(0.1)
+    proc.kill()
+    raise RuntimeError("streamlit server did not come up")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default="http://127.0.0.1:8501", help="app (or load balancer) URL")
+    parser.add_argument("--start-server", action="store_true",
+                        help="start `streamlit run manualapp.py` on a free port and test that")
+    parser.add_argument("--server-pid", type=int, action="append", default=[],
+                        help="server process to sample memory from (repeatable, one per replica)")
+    parser.add_argument("--sessions", type=int, default=50, help="concurrent sessions")
+    parser.add_argument("--clicks", type=int, default=10, help="route changes per session")
+    parser.add_argument("--ramp", type=float, default=2.0, help="seconds over which sessions connect")
+    parser.add_argument("--timeout", type=float, default=30.0, help="per-rerun timeout in seconds")
+    parser.add_argument("--image-mode", default=None, help="MANUAL_IMAGE_MODE for --start-server")
+    args = parser.parse_args()
+
+    server = None
+    pids = list(args.server_pid)
+    if args.start_server:
+        port = free_port()
+        extra_env = {"MANUAL_IMAGE_MODE": args.image_mode} if args.image_mode else {}
+        server = start_server(port, extra_env)
+        args.url = f"http://127.0.0.1:{port}"
+        pids.append(server.pid)
+
+    try:
+        latencies, errors, elapsed, before, after, opened = asyncio.run(run_load(
+            args.url, args.sessions, args.clicks, args.ramp, args.timeout, pids))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    print(f"sessions      {args.sessions} ({opened} connected, {len(errors)} failed)")
+    print(f"reruns        {len(latencies)} in {elapsed:.2f} s = {len(latencies) / elapsed:.1f} reruns/s")
+    if latencies:
+        ms = [value * 1000 for value in latencies]
+        print(f"latency ms    p50 {percentile(ms, 50):.1f}  p99 {percentile(ms, 99):.1f}  "
+              f"max {max(ms):.1f}  mean {statistics.mean(ms):.1f}")
+    if pids:
+        per_session = (after - before) / max(opened, 1)
+        print(f"server RSS    {before / 1024:.1f} MiB -> {after / 1024:.1f} MiB "
+              f"({per_session:.0f} KiB per open session)")
+    for error in sorted(set(errors))[:5]:
+        print(f"error         {error}")
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+"""Startup budget report for manualapp.py.
+
+Two measurements, each in a fresh interpreter:
+
+* ``python -X importtime -c "import manualapp"`` - what importing the app costs,
+  grouped by top-level package, heaviest first;
+* first paint per entry route - time from interpreter start to the first
+  complete run of the app (AppTest), for the welcome screen and for a deep link
+  to every page, showing which pages pull in extra dependencies.
+
+    python benchmarks/startup_budget.py [--budget-ms 750]
+
+Exits non-zero when importing the app takes longer than the budget.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(HERE)
+sys.path.insert(0, REPO_ROOT)
+
+FIRST_PAINT_CHILD = """
+import json, sys, time
+start = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file(sys.argv[1], default_timeout=60)
+for name, value in json.loads(sys.argv[2]).items():
+    at.query_params[name] = value
+at.run()
+if at.exception:
+    sys.exit(at.exception[0].value)
+heavy = [name for name in ("pandas", "numpy", "pyarrow") if name in sys.modules]
+print(json.dumps({"ms": (time.perf_counter() - start) * 1000, "heavy": heavy}))
+"""
+
+
+def import_times():
+    """Self and cumulative import time per top-level package, in ms."""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import manualapp"],
+        cwd=REPO_ROOT, capture_output=True, text=True, check=True,
+    ).stderr
+    packages = {}
+    total_us = 0
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        package = name.strip().split(".")[0]
+        packages[package] = packages.get(package, 0) + int(self_us)
+        if not name[1:].startswith(" "):  # not nested under another import
+            total_us += int(cumulative_us)
+    return total_us / 1000, {name: us / 1000 for name, us in packages.items()}
+
+
+def first_paint(query_params, repeat):
+    samples, heavy = [], []
+    for _ in range(repeat):
+        out = subprocess.run(
+            [sys.executable, "-c", FIRST_PAINT_CHILD, os.path.join(REPO_ROOT, "manualapp.py"),
+             json.dumps(query_params)],
+            cwd=REPO_ROOT, capture_output=True, text=True, check=True,
+        ).stdout
+        result = json.loads(out.strip().splitlines()[-1])
+        samples.append(result["ms"])
+        heavy = result["heavy"]
+    return statistics.median(samples), heavy
+
+
+def main():
+    import manual_content
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget-ms", type=float, default=750,
+                        help="maximum time to import manualapp (default 750)")
+    parser.add_argument("--repeat", type=int, default=3, help="samples per route (median is kept)")
+    parser.add_argument("--top", type=int, default=12, help="packages to list")
+    args = parser.parse_args()
+
+    total_ms, packages = import_times()
+    print(f"import manualapp: {total_ms:.1f} ms (budget {args.budget_ms:.0f} ms)")
+    for name, ms in sorted(packages.items(), key=lambda item: -item[1])[:args.top]:
+        print(f"  {name:<24} {ms:>8.1f} ms")
+
+    print("\nfirst paint (fresh interpreter -> first complete run)")
+    entries = [("welcome", {})] + [
+        (f"{page}/{section}", {"page": page, "section": section})
+        for _, _, page, section in manual_content.ROUTES
+    ]
+    for label, params in entries:
+        ms, heavy = first_paint(params, args.repeat)
+        print(f"  {label:<40} {ms:>8.1f} ms   loaded: {', '.join(heavy) or '-'}")
+
+    if total_ms > args.budget_ms:
+        print(f"\nOVER BUDGET: importing manualapp took {total_ms:.1f} ms")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
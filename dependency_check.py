@@ -0,0 +1,137 @@
+"""Installed-version and import-cost checks for the attendance app's libraries.
+
+The "Required Library" page lists what the attendance app needs. This module
+answers two questions about the Python environment running the manual:
+
+* which of those libraries are installed, and at what version - read from
+  package metadata, in parallel, without importing anything;
+* what each one costs to import - measured in a fresh interpreter per library,
+  one at a time so the measurements do not compete for CPU.
+
+    python dependency_check.py [--import-times]
+
+prints the same report in a terminal.
+"""
+import argparse
+import importlib.metadata
+import importlib.util
+import platform
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+# Imports a module in a fresh interpreter and prints how long that took.
+IMPORT_CHILD = """
+import importlib, sys, time
+start = time.perf_counter()
+importlib.import_module(sys.argv[1])
+print((time.perf_counter() - start) * 1000)
+"""
+
+
+@dataclass(frozen=True)
+class Library:
+    """A library as listed in the manual.
+
+    ``distribution`` is the name pip knows it by (None for the standard
+    library) and ``module`` is what the attendance app imports.
+    """
+    name: str
+    distribution: str
+    module: str
+
+
+def installed_version(library):
+    """Installed version of ``library``, or None when it is missing."""
+    if library.distribution is None:
+        return f"built-in (Python {platform.python_version()})"
+    try:
+        return importlib.metadata.version(library.distribution)
+    except importlib.metadata.PackageNotFoundError:
+        pass
+    # Installed without metadata (e.g. copied in by hand). Not tried for
+    # submodules: finding one imports its parent, and a namespace parent such
+    # as ``google`` is there whenever any google-* package is
+    if "." not in library.module and importlib.util.find_spec(library.module) is not None:
+        return "installed (version unknown)"
+    return None
+
+
+def check_versions(libraries, max_workers=8):
+    """``{library.name: version or None}``, looked up in parallel."""
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        versions = pool.map(installed_version, libraries)
+        return dict(zip((library.name for library in libraries), versions))
+
+
+def import_time_ms(module, timeout=120):
+    """Milliseconds ``import module`` takes in a fresh interpreter, or None if it fails."""
+    try:
+        result = subprocess.run(
+            [sys.executable, "-c", IMPORT_CHILD, module],
+            capture_output=True, text=True, timeout=timeout,
+        )
+    except subprocess.TimeoutExpired:
+        return None
+    if result.returncode != 0:
+        return None
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def import_times(libraries, versions=None):
+    """``{library.name: ms or None}`` for every installed library."""
+    versions = versions if versions is not None else check_versions(libraries)
+    return {library.name: import_time_ms(library.module) if versions[library.name] else None
+            for library in libraries}
+
+
+def report_rows(libraries, versions, times=None):
+    """Table rows for the manual and the command line, in page order."""
+    rows = []
+    for library in libraries:
+        version = versions[library.name]
+        row = {
+            "library": library.name,
+            "status": "✅" if version else "❌ missing",
+            "version": version or "",
+            "install": f"pip install {library.distribution}" if library.distribution and not version else "",
+        }
+        if times is not None:
+            ms = times.get(library.name)
+            row["import_ms"] = round(ms, 1) if ms is not None else None
+        rows.append(row)
+    return rows
+
+
+def required_libraries():
+    """The libraries checked on the manual's Required Library page."""
+    import manual_content
+
+    for block in manual_content.build_page("Installation Guide", "Required Library"):
+        for child in block.children or (block,):
+            if child.kind == "dependency_check":
+                return child.body
+    return ()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--import-times", action="store_true",
+                        help="also time each import in a fresh interpreter")
+    args = parser.parse_args()
+
+    libraries = required_libraries()
+    versions = check_versions(libraries)
+    times = import_times(libraries, versions) if args.import_times else None
+    print(f"Python {platform.python_version()} at {sys.executable}")
+    for row in report_rows(libraries, versions, times):
+        line = f"  {row['status']:<10} {row['library']:<26} {row['version'] or row['install']}"
+        if times is not None and row["import_ms"] is not None:
+            line = f"{line:<70} {row['import_ms']:>8.1f} ms"
+        print(line)
+    return 0 if all(versions.values()) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
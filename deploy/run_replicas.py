@@ -0,0 +1,135 @@
+"""Run several stateless replicas of the manual behind a local load balancer.
+
+    python deploy/run_replicas.py --replicas 3 --port 8080
+
+starts ``streamlit run manualapp.py`` on ports 8511, 8512, ... and a small TCP
+round-robin balancer on ``--port``. Each browser connection (and so each
+websocket session) sticks to the replica it was handed to; nothing else is
+shared between replicas:
+
+* screenshots are served as content-hashed static files (MANUAL_IMAGE_MODE=
+  static), identical on every replica, instead of per-process media URLs;
+* the page being read lives in the URL (``?page=&section=``), so a session
+  that reconnects to another replica reopens on the same page;
+* all replicas share one cookie secret, so XSRF cookies verify anywhere;
+* the page and search caches are rebuilt per process from the same content.
+
+In production put nginx in front instead, see ``deploy/nginx-replicas.conf``.
+"""
+import argparse
+import asyncio
+import itertools
+import os
+import secrets
+import signal
+import subprocess
+import sys
+import time
+import urllib.request
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+import image_assets  # noqa: E402
+
+
+def replica_env(cookie_secret):
+    return dict(
+        os.environ,
+        MANUAL_IMAGE_MODE="static",
+        STREAMLIT_SERVER_ENABLE_STATIC_SERVING="true",
+        STREAMLIT_SERVER_COOKIE_SECRET=cookie_secret,
+        STREAMLIT_SERVER_HEADLESS="true",
+        STREAMLIT_BROWSER_GATHER_USAGE_STATS="false",
+    )
+
+
+def start_replicas(count, first_port, cookie_secret):
+    env = replica_env(cookie_secret)
+    replicas = []
+    for port in range(first_port, first_port + count):
+        proc = subprocess.Popen(
+            [sys.executable, "-m", "streamlit", "run", "manualapp.py",
+             "--server.port", str(port), "--server.address", "127.0.0.1"],
+            cwd=REPO_ROOT, env=env,
+        )
+        replicas.append((port, proc))
+    for port, proc in replicas:
+        wait_healthy(port, proc)
+    return replicas
+
+
+def wait_healthy(port, proc, timeout=60):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f"replica on port {port} exited with {proc.returncode}")
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1):
+                return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"replica on port {port} did not become healthy")
+
+
+async def pipe(reader, writer):
+    try:
+        while data := await reader.read(65536):
+            writer.write(data)
+            await writer.drain()
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+
+
+async def balance(host, port, upstream_ports):
+    """Hand each incoming connection to the next replica, round robin."""
+    upstreams = itertools.cycle(upstream_ports)
+
+    async def handle(client_reader, client_writer):
+        try:
+            upstream_reader, upstream_writer = await asyncio.open_connection("127.0.0.1", next(upstreams))
+        except OSError:
+            client_writer.close()
+            return
+        await asyncio.gather(pipe(client_reader, upstream_writer), pipe(upstream_reader, client_writer))
+
+    server = await asyncio.start_server(handle, host, port)
+    async with server:
+        await server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--replicas", type=int, default=3)
+    parser.add_argument("--first-port", type=int, default=8511, help="port of the first replica")
+    parser.add_argument("--host", default="127.0.0.1", help="balancer address")
+    parser.add_argument("--port", type=int, default=8080, help="balancer port")
+    args = parser.parse_args()
+
+    # Build the screenshots once up front so replicas never race to write them
+    os.chdir(REPO_ROOT)
+    image_assets.build_all()
+
+    cookie_secret = os.environ.get("STREAMLIT_SERVER_COOKIE_SECRET") or secrets.token_hex(32)
+    replicas = start_replicas(args.replicas, args.first_port, cookie_secret)
+    pids = " ".join(f"--server-pid {proc.pid}" for _, proc in replicas)
+    print(f"\n{len(replicas)} replicas on ports "
+          f"{', '.join(str(port) for port, _ in replicas)}, balanced on http://{args.host}:{args.port}")
+    print(f"load test: python benchmarks/load_test.py --url http://{args.host}:{args.port} {pids}\n")
+
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    try:
+        asyncio.run(balance(args.host, args.port, [port for port, _ in replicas]))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for _, proc in replicas:
+            proc.terminate()
+        for _, proc in replicas:
+            proc.wait()
+
+
+if __name__ == "__main__":
+    main()
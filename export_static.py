@@ -0,0 +1,207 @@
+"""Export the whole manual as a static HTML site.
+
+Walks every route in ``manual_content.ROUTES`` and writes the same block trees
+the Streamlit app draws as plain HTML, so the read-only manual can be served by
+any static file server:
+
+    python export_static.py [output_dir]    # default: site/
+
+The site is built in a temporary directory and then swapped in. An existing
+output directory is only replaced if an earlier export wrote it (it holds a
+``.manual-export`` marker) or it is empty.
+
+Stylesheet and screenshots get content-hashed file names, so the bundle can be
+served with long-lived cache headers. Needs the ``markdown-it-py`` package
+(``pip install markdown-it-py``).
+"""
+import hashlib
+import html
+import os
+import shutil
+import sys
+import tempfile
+import textwrap
+
+import image_assets
+import manual_content
+
+try:
+    from markdown_it import MarkdownIt
+except ImportError:  # only needed for exporting, not for running the app
+    MarkdownIt = None
+
+# Written into every export; only directories holding it are ever replaced.
+EXPORT_MARKER = ".manual-export"
+
+SITE_TITLE = "Attendance System with Auto Report Guide & Manual"
+
+STYLESHEET = """\
+body { margin: 0; font-family: "Source Sans Pro", sans-serif; color: #31333f; line-height: 1.6; }
+nav { position: fixed; top: 0; bottom: 0; left: 0; width: 16rem; padding: 1.5rem; background: #f0f2f6; overflow-y: auto; }
+nav h2 { font-size: 1.1rem; }
+nav ul { list-style: none; padding-left: 0.5rem; }
+nav a { color: #31333f; text-decoration: none; }
+nav a.active { font-weight: 600; }
+main { max-width: 740px; margin-left: 19rem; padding: 2rem 1rem 4rem 3rem; }
+pre { background: #f0f2f6; padding: 1rem; border-radius: 0.5rem; overflow-x: auto; }
+img { max-width: 100%; height: auto; }
+hr { border: none; border-top: 1px solid #e6e6e6; margin: 2rem 0; }
+.info { background: #e8f2fc; color: #004280; padding: 1rem; border-radius: 0.5rem; }
+table { border-collapse: collapse; }
+th, td { border: 1px solid #e6e6e6; padding: 0.25rem 0.75rem; text-align: left; }
+"""
+
+
+def fingerprint(name, data):
+    stem, ext = os.path.splitext(name)
+    return f"{stem}-{hashlib.sha256(data).hexdigest()[:12]}{ext}"
+
+
+def route_path(page_slug, section_slug):
+    return f"{page_slug}/{section_slug}/index.html"
+
+
+class SiteWriter:
+    """Writes pages into ``out_dir`` and collects the assets they reference."""
+
+    def __init__(self, out_dir):
+        self.out_dir = out_dir
+        self.assets = os.path.join(out_dir, "assets")
+        os.makedirs(self.assets, exist_ok=True)
+        # CommonMark plus GFM tables, close to what st.markdown renders
+        self.markdown = MarkdownIt("commonmark").enable("table")
+        css = STYLESHEET.encode("utf-8")
+        self.stylesheet = f"assets/{fingerprint('style.css', css)}"
+        self._write(self.stylesheet, css)
+
+    def _write(self, rel_path, data):
+        path = os.path.join(self.out_dir, rel_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(data)
+
+    def image(self, path, width):
+        """Copy the 1x and 2x WebP variants into the bundle; return <img> HTML."""
+        urls = []
+        for scale in (1, 2):
+            built = image_assets.build_asset(path, width * scale, "WEBP")
+            shutil.copyfile(built, os.path.join(self.assets, os.path.basename(built)))
+            urls.append(f"{{root}}assets/{os.path.basename(built)}")
+        alt = html.escape(os.path.splitext(os.path.basename(path))[0])
+        return (f'<img src="{urls[0]}" srcset="{urls[0]} 1x, {urls[1]} 2x" '
+                f'width="{width}" alt="{alt}" loading="lazy" decoding="async">')
+
+    def render(self, blocks):
+        return "\n".join(self.render_block(block) for block in blocks)
+
+    def render_block(self, block):
+        if block.kind == "section":
+            return f'<section id="{block.key}">\n{self.render(block.children)}\n</section>'
+        if block.kind == "image":
+            return self.image(block.body, block.width)
+        if block.kind == "title":
+            return f"<h1>{html.escape(block.body)}</h1>"
+        if block.kind == "header":
+            return f"<h2>{html.escape(block.body)}</h2>"
+        if block.kind == "subheader":
+            return f"<h3>{html.escape(block.body)}</h3>"
+        if block.kind == "code":
+            return f"<pre><code>{html.escape(block.body)}</code></pre>"
+        if block.kind == "info":
+            return f'<div class="info">{html.escape(block.body)}</div>'
+        if block.kind == "table":
+            return block.body.to_html(border=0)
+        if block.kind == "dependency_check":
+            # Needs a live Python environment; point at the command-line version
+            return ('<div class="info">Run <code>python dependency_check.py --import-times</code> '
+                    'to check which of these libraries are installed and what they cost to import.</div>')
+        # "markdown" and "write" - st.markdown dedents its body, so do the same
+        return self.markdown.render(textwrap.dedent(block.body))
+
+    def nav(self, current=None):
+        items = []
+        category = None
+        for route in manual_content.ROUTES:
+            if route[0] != category:
+                if category is not None:
+                    items.append("</ul>")
+                category = route[0]
+                items.append(f"<h2>{html.escape(category)}</h2>\n<ul>")
+            active = ' class="active"' if route == current else ""
+            items.append(f'<li><a{active} href="{{root}}{route_path(route[2], route[3])}">'
+                         f'{html.escape(route[1])}</a></li>')
+        items.append("</ul>")
+        return f'<nav>\n<h1><a href="{{root}}index.html">{html.escape(SITE_TITLE)}</a></h1>\n' \
+               + "\n".join(items) + "\n</nav>"
+
+    def page(self, rel_path, body, route=None):
+        root = "../" * rel_path.count("/")
+        document = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{html.escape(route[1] + " - " if route else "")}App Guide &amp; Manual</title>
+<link rel="stylesheet" href="{{root}}{self.stylesheet}">
+</head>
+<body>
+{self.nav(route)}
+<main>
+{body}
+</main>
+</body>
+</html>
+"""
+        self._write(rel_path, document.replace("{root}", root).encode("utf-8"))
+
+
+def check_replaceable(out_dir):
+    """Refuse to overwrite anything but an earlier export or an empty directory."""
+    if not os.path.lexists(out_dir):
+        return
+    if not os.path.isdir(out_dir) or os.path.islink(out_dir):
+        sys.exit(f"{out_dir} exists and is not a directory; not overwriting it")
+    if os.listdir(out_dir) and not os.path.isfile(os.path.join(out_dir, EXPORT_MARKER)):
+        sys.exit(f"{out_dir} is not empty and was not written by export_static.py; "
+                 f"choose another output directory")
+
+
+def export(out_dir="site"):
+    if MarkdownIt is None:
+        sys.exit("Exporting needs the 'markdown-it-py' package: pip install markdown-it-py")
+    out_dir = os.path.normpath(out_dir)
+    check_replaceable(out_dir)
+
+    # Build next to the destination and swap it in at the end, so a failed
+    # export leaves the previous site untouched
+    parent = os.path.dirname(os.path.abspath(out_dir))
+    os.makedirs(parent, exist_ok=True)
+    build_dir = tempfile.mkdtemp(prefix=".export-", dir=parent)
+    try:
+        site = SiteWriter(build_dir)
+        site.page("index.html", '<div class="info">Welcome to the App Guide &amp; Manual! '
+                                'Please select a section from the sidebar to begin.</div>')
+        for route in manual_content.ROUTES:
+            category, sub_page, page_slug, section_slug = route
+            body = site.render(manual_content.build_page(category, sub_page))
+            site.page(route_path(page_slug, section_slug), body, route)
+            print(f"wrote {route_path(page_slug, section_slug)}")
+        with open(os.path.join(build_dir, EXPORT_MARKER), "w", encoding="utf-8") as f:
+            f.write("Written by export_static.py; the whole directory is replaced on the next export.\n")
+    except BaseException:
+        shutil.rmtree(build_dir, ignore_errors=True)
+        raise
+
+    if os.path.isdir(out_dir):
+        old_dir = tempfile.mkdtemp(prefix=".export-old-", dir=parent)
+        os.rmdir(old_dir)
+        os.rename(out_dir, old_dir)
+        os.rename(build_dir, out_dir)
+        shutil.rmtree(old_dir)
+    else:
+        os.rename(build_dir, out_dir)
+    return out_dir
+
+
+if __name__ == "__main__":
+    export(*sys.argv[1:2])
@@ -0,0 +1,204 @@
+"""Pre-processed screenshot assets for the manual.
+
+Every screenshot in ``images/`` is resized to the width it is displayed at,
+re-encoded and written to ``static/manual/`` under a name derived from the
+source file's content hash, so an edited screenshot never reuses a stale asset.
+The app reads these through a small bounded in-process cache instead of letting
+``st.image`` open, decode and re-encode the original JPEG on every rerun.
+
+Run ``python image_assets.py`` to build all variants ahead of time and print a
+size / decode-time report. Missing variants are also built on first use.
+
+With ``MANUAL_IMAGE_MODE=static`` the pages reference the built files by URL
+(``MANUAL_ASSET_URL``, by default Streamlit's ``/app/static/manual`` route)
+instead of pushing bytes through Streamlit's media endpoint, so browsers and
+proxies can cache them across sessions; see ``asset_server.py``.
+"""
+import hashlib
+import io
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+from PIL import Image
+
+# Relative image paths in the content files are resolved against this
+# directory, so the manual works from any working directory.
+HERE = os.path.dirname(os.path.abspath(__file__))
+IMAGE_DIR = os.path.join(HERE, "images")
+# Streamlit serves static/ next to the main script, which lives here too.
+BUILD_DIR = os.path.join(HERE, "static", "manual")
+
+# The width every screenshot is shown at in the manual pages.
+DISPLAY_WIDTH = 700
+
+# st.image passes JPEG/PNG/GIF bytes through untouched when they are no wider
+# than the requested width, but re-encodes anything else to JPEG. So the bytes
+# handed to st.image are JPEG at display width; WebP (1x and 2x) is built for
+# pages that can reference the files directly.
+JPEG_QUALITY = 80
+WEBP_QUALITY = 80
+EXTENSIONS = {"JPEG": "jpg", "WEBP": "webp"}
+
+# Width of the blurry stand-in shown while a screenshot has not been requested
+# yet. It is stretched to the display width by the browser and costs well under
+# a kilobyte.
+PLACEHOLDER_WIDTH = 24
+
+# "media": st.image gets bytes and Streamlit serves them per session.
+# "static": st.image gets a content-hashed URL under ASSET_URL.
+IMAGE_MODE = os.environ.get("MANUAL_IMAGE_MODE", "media")
+ASSET_URL = os.environ.get("MANUAL_ASSET_URL", "/app/static/manual").rstrip("/")
+
+# Upper bound for the in-process cache of encoded bytes.
+CACHE_MAX_BYTES = 8 * 1024 * 1024
+
+_cache = OrderedDict()
+_cache_bytes = 0
+_digests = {}
+_lock = threading.Lock()
+
+
+def source_path(path):
+    """``path`` resolved against the manual's directory if it is relative."""
+    return os.path.join(HERE, path)
+
+
+def source_digest(path):
+    """Content hash of a source image, re-read only when the file changes."""
+    path = source_path(path)
+    stat = os.stat(path)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cached = _digests.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    with open(path, "rb") as f:
+        digest = hashlib.sha256(f.read()).hexdigest()[:12]
+    _digests[path] = (stamp, digest)
+    return digest
+
+
+def asset_name(path, width, fmt="JPEG"):
+    """File name of the optimized variant, e.g. ``add-class-3f9c0e1a2b4d-700.jpg``."""
+    stem = os.path.splitext(os.path.basename(path))[0].replace(" ", "-")
+    return f"{stem}-{source_digest(path)}-{width}.{EXTENSIONS[fmt]}"
+
+
+def encode(path, width, fmt="JPEG"):
+    """Resize ``path`` to at most ``width`` pixels wide and re-encode it.
+
+    Images are never upscaled, so a 2x variant of a screenshot that is narrower
+    than twice the display width is simply the full-resolution image.
+    """
+    with Image.open(source_path(path)) as img:
+        img = img.convert("RGB")
+        if img.width > width:
+            height = round(img.height * width / img.width)
+            img = img.resize((width, height), Image.LANCZOS)
+        buf = io.BytesIO()
+        if fmt == "JPEG":
+            img.save(buf, "JPEG", quality=JPEG_QUALITY, optimize=True)
+        else:
+            img.save(buf, fmt, quality=WEBP_QUALITY, method=6)
+    return buf.getvalue()
+
+
+def build_asset(path, width, fmt="JPEG"):
+    """Write the optimized variant to BUILD_DIR if it is missing and return its path."""
+    target = os.path.join(BUILD_DIR, asset_name(path, width, fmt))
+    if not os.path.exists(target):
+        data = encode(path, width, fmt)
+        os.makedirs(BUILD_DIR, exist_ok=True)
+        # Write to a temporary name first so concurrent sessions never read a
+        # half-written file.
+        tmp = f"{target}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, target)
+    return target
+
+
+def load(path, width=DISPLAY_WIDTH, fmt="JPEG"):
+    """Return the optimized bytes for ``path``, ready to pass to ``st.image``."""
+    global _cache_bytes
+    key = asset_name(path, width, fmt)
+    with _lock:
+        data = _cache.get(key)
+        if data is not None:
+            _cache.move_to_end(key)
+            return data
+
+    with open(build_asset(path, width, fmt), "rb") as f:
+        data = f.read()
+
+    with _lock:
+        if key not in _cache:
+            _cache[key] = data
+            _cache_bytes += len(data)
+            while _cache_bytes > CACHE_MAX_BYTES and len(_cache) > 1:
+                _, evicted = _cache.popitem(last=False)
+                _cache_bytes -= len(evicted)
+    return data
+
+
+def placeholder(path, width=DISPLAY_WIDTH):
+    """Tiny low-quality stand-in for ``path``; pass ``width`` on to ``st.image``."""
+    return load(path, PLACEHOLDER_WIDTH)
+
+
+def url(path, width=DISPLAY_WIDTH, fmt="WEBP"):
+    """Content-hashed URL of a built variant, for ``st.image`` to reference.
+
+    st.image passes URLs to the browser untouched, so unlike ``load`` this can
+    use WebP.
+    """
+    return f"{ASSET_URL}/{os.path.basename(build_asset(path, width, fmt))}"
+
+
+def variants(width=DISPLAY_WIDTH):
+    """(width, format) pairs built for every screenshot."""
+    return [(width, "JPEG"), (width, "WEBP"), (width * 2, "WEBP")]
+
+
+def _decode_ms(data, repeat=5):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        with Image.open(io.BytesIO(data)) as img:
+            img.load()
+    return (time.perf_counter() - start) * 1000 / repeat
+
+
+def build_all(image_dir=IMAGE_DIR, out=sys.stdout):
+    """Build every variant for every screenshot and print a size report."""
+    sources = sorted(
+        os.path.join(image_dir, name)
+        for name in os.listdir(image_dir)
+        if name.lower().endswith((".jpg", ".jpeg", ".png"))
+    )
+    total_original = total_optimized = total_webp = 0
+    out.write(f"{'image':<32} {'original':>10} {'jpeg':>10} {'webp':>10} {'saved':>6} "
+              f"{'decode ms':>10} {'-> jpeg ms':>10}\n")
+    for path in sources:
+        for width, fmt in variants():
+            build_asset(path, width, fmt)
+        with open(source_path(path), "rb") as f:
+            original = f.read()
+        with open(build_asset(path, DISPLAY_WIDTH), "rb") as f:
+            optimized = f.read()
+        webp = os.path.getsize(build_asset(path, DISPLAY_WIDTH, "WEBP"))
+        total_original += len(original)
+        total_optimized += len(optimized)
+        total_webp += webp
+        saved = 100 * (1 - len(optimized) / len(original))
+        out.write(f"{os.path.basename(path):<32} {len(original):>10,} {len(optimized):>10,} {webp:>10,} "
+                  f"{saved:>5.0f}% {_decode_ms(original):>10.2f} {_decode_ms(optimized):>10.2f}\n")
+    if sources:
+        saved = 100 * (1 - total_optimized / total_original)
+        out.write(f"{'total':<32} {total_original:>10,} {total_optimized:>10,} {total_webp:>10,} "
+                  f"{saved:>5.0f}%\n")
+
+
+if __name__ == "__main__":
+    build_all()
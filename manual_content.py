@@ -0,0 +1,279 @@
+"""Content definitions for the App Guide & Manual.
+
+Pages are described once as a tree of typed blocks instead of being drawn
+straight to Streamlit, and ``manualapp.py`` replays the tree on each rerun. The
+text itself lives in ``content/``, one TOML file per section; every file is
+parsed once and again only after it changes on disk, so wording fixes show up
+on the next rerun without restarting the server.
+"""
+import logging
+import os
+import threading
+import textwrap
+import tomllib
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class Block:
+    """A single piece of page content.
+
+    ``kind`` names the Streamlit element used to draw it (``"markdown"``,
+    ``"image"``, ...). Sections use ``kind="section"`` and hold their content in
+    ``children``.
+    """
+    kind: str
+    body: object = None
+    width: int = None
+    key: str = None
+    children: tuple = ()
+
+    @property
+    def heading(self):
+        """The header/subheader a section starts with, or None."""
+        if self.children and self.children[0].kind in ("header", "subheader"):
+            return self.children[0]
+        return None
+
+    @property
+    def has_images(self):
+        return self.kind == "image" or any(child.has_images for child in self.children)
+
+
+class Page:
+    """Records blocks with the same call shape as the ``st.*`` functions.
+
+    ``section(key)`` opens a named group; everything recorded afterwards goes
+    into it until the next ``section()`` call or ``end_section()``.
+    """
+
+    def __init__(self):
+        self._blocks = []
+        self._section = None
+
+    def _add(self, block):
+        if self._section is not None:
+            self._section[1].append(block)
+        else:
+            self._blocks.append(block)
+
+    def section(self, key):
+        self.end_section()
+        self._section = (key, [])
+
+    def end_section(self):
+        if self._section is not None:
+            key, children = self._section
+            self._section = None
+            self._blocks.append(Block("section", key=key, children=tuple(children)))
+
+    def title(self, body):
+        self._add(Block("title", body))
+
+    def header(self, body):
+        self._add(Block("header", body))
+
+    def subheader(self, body):
+        self._add(Block("subheader", body))
+
+    def markdown(self, body):
+        self._add(Block("markdown", body))
+
+    def write(self, body):
+        self._add(Block("write", body))
+
+    def code(self, body):
+        self._add(Block("code", body))
+
+    def info(self, body):
+        self._add(Block("info", body))
+
+    def image(self, path, width):
+        self._add(Block("image", path, width=width))
+
+    def table(self, data):
+        self._add(Block("table", data))
+
+    def dependency_check(self, libraries):
+        """Installed versions and import times of ``libraries``, checked live."""
+        self._add(Block("dependency_check", tuple(libraries)))
+
+    @property
+    def blocks(self):
+        self.end_section()
+        return tuple(self._blocks)
+
+
+CONTENT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "content")
+
+# Block kinds whose value is just the text handed to the ``st.*`` function.
+TEXT_KINDS = ("title", "header", "subheader", "markdown", "write", "code", "info")
+
+# Width of screenshots that don't give one.
+IMAGE_WIDTH = 700
+
+logger = logging.getLogger(__name__)
+
+# Content file path -> ((mtime_ns, size), parsed contents).
+_files = {}
+_files_lock = threading.Lock()
+_revision = 0
+
+
+def _record(page, entry, path):
+    """Record one ``[[blocks]]`` entry of a content file on ``page``."""
+    kinds = [name for name in entry if name != "width"]
+    if len(kinds) != 1:
+        raise ValueError(f"{path}: a block needs exactly one kind, got {', '.join(sorted(entry))}")
+    kind = kinds[0]
+    value = entry[kind]
+    if kind in TEXT_KINDS:
+        # Bodies may be indented to sit under their key; markdown would read
+        # four leading spaces as a code block
+        getattr(page, kind)(textwrap.dedent(value))
+    elif kind == "image":
+        page.image(value, width=entry.get("width", IMAGE_WIDTH))
+    elif kind == "table":
+        # Only pages with a table pay for importing pandas
+        import pandas as pd
+        page.table(pd.DataFrame(value))
+    elif kind == "dependency_check":
+        from dependency_check import Library
+        page.dependency_check(Library(item["name"], item.get("distribution"), item["module"])
+                              for item in value)
+    else:
+        raise ValueError(f"{path}: unknown block kind {kind!r}")
+
+
+def _blocks(entries, path, section=None):
+    page = Page()
+    if section is not None:
+        page.section(section)
+    for entry in entries:
+        _record(page, entry, path)
+    return page.blocks
+
+
+def _parse_category(data, path):
+    return {name: _blocks(data.get(name, ()), path) for name in ("before", "after", "landing")}
+
+
+def _parse_page(data, path):
+    return {"blocks": _blocks(data.get("blocks", ()), path),
+            "sections": tuple(data.get("sections", ()))}
+
+
+def _parse_section(data, path):
+    key = os.path.splitext(os.path.basename(path))[0]
+    return _blocks(data.get("blocks", ()), path, section=key)[0]
+
+
+def _load(path, parse, optional=False):
+    """Parsed contents of ``path``, read again only when its mtime or size changes.
+
+    If an edited file no longer parses, or is briefly missing (an editor's
+    atomic save, a section listed before its file exists), the previous version
+    keeps being served and the error is logged, so a half-saved edit can't
+    break the manual for everyone reading it. With no previous version the
+    error is raised, or None is returned when ``optional`` is set.
+    """
+    global _revision
+    cached = _files.get(path)
+    try:
+        stat = os.stat(path)
+    except OSError as exc:
+        return _fall_back(path, cached, exc, optional)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    with _files_lock:
+        cached = _files.get(path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        try:
+            with open(path, "rb") as f:
+                parsed = parse(tomllib.load(f), path)
+        except (OSError, ValueError, KeyError, TypeError) as exc:
+            if cached is not None and not isinstance(exc, OSError):
+                # Don't retry until the file changes again
+                _files[path] = (stamp, cached[1])
+            return _fall_back(path, cached, exc, optional)
+        _files[path] = (stamp, parsed)
+        _revision += 1
+        return parsed
+
+
+def _fall_back(path, cached, exc, optional):
+    if cached is not None:
+        logger.warning("%s: %s; still showing the previous version", path, exc)
+        return cached[1]
+    if optional:
+        logger.warning("%s: %s; leaving it out", path, exc)
+        return None
+    raise exc
+
+
+def build_page(category, sub_page=None):
+    """Return the block tree for a (category, sub_page) route.
+
+    The tree is put together from the route's content files on every call,
+    which costs a ``stat`` per file; only files that changed are parsed again.
+    """
+    page_slug, _ = route_slugs(category)
+    if page_slug is None:
+        raise KeyError(category)
+    _, section_slug = route_slugs(category, sub_page)
+    category_dir = os.path.join(CONTENT_DIR, page_slug)
+    shared = _load(os.path.join(category_dir, "_category.toml"), _parse_category)
+    if section_slug is None:
+        body = shared["landing"]
+    else:
+        page_dir = os.path.join(category_dir, section_slug)
+        page = _load(os.path.join(page_dir, "_page.toml"), _parse_page)
+        # A section that can't be loaded is left out rather than breaking the page
+        sections = (_load(os.path.join(page_dir, f"{key}.toml"), _parse_section, optional=True)
+                    for key in page["sections"])
+        body = page["blocks"] + tuple(section for section in sections if section is not None)
+    return shared["before"] + body + shared["after"]
+
+
+def revision():
+    """A number that changes whenever a content file has been (re)parsed."""
+    return _revision
+
+
+# Every page the manual can show, as (category, sub_page, page slug, section
+# slug). The slugs are used for exported file paths and links.
+ROUTES = (
+    ("Installation Guide", "General Requirement", "installation-guide", "general-requirement"),
+    ("Installation Guide", "Required Library", "installation-guide", "required-library"),
+    ("User Manual", "For Students", "user-manual", "for-students"),
+    ("User Manual", "For Admins", "user-manual", "for-admins"),
+    ("About", "App Info", "about", "app-info"),
+    ("About", "Contact", "about", "contact"),
+)
+
+
+def find_route(page_slug, section_slug=None):
+    """Return (category, sub_page) for URL slugs, or None if they are unknown.
+
+    A known page slug without a section gives the category's landing view.
+    """
+    for category, sub_page, page, section in ROUTES:
+        if page == page_slug:
+            if section_slug is None:
+                return category, None
+            if section == section_slug:
+                return category, sub_page
+    return None
+
+
+def route_slugs(category, sub_page=None):
+    """Return the (page, section) URL slugs for a route; either may be None."""
+    for route_category, route_sub_page, page, section in ROUTES:
+        if route_category == category:
+            if sub_page is None:
+                return page, None
+            if route_sub_page == sub_page:
+                return page, section
+    return None, None
@@ -1,5 +1,13 @@
+import sys
+
 import streamlit as st
-import pandas as pd
+
+import dependency_check
+import image_assets
+import manual_content
+import render_metrics
+import search_index
+
 
 def main():
     # Set the page configuration to 'centered'
@@ -23,6 +31,11 @@ def main():
         unsafe_allow_html=True
     )
     
+    # Opt-in render instrumentation (MANUAL_METRICS=1 or ?debug=metrics)
+    metrics_enabled = render_metrics.env_enabled() or st.query_params.get("debug") == "metrics"
+    if metrics_enabled:
+        render_metrics.begin()
+
     # Initialize session state for navigation if not already present
     if 'active_page_category' not in st.session_state:
         st.session_state.active_page_category = None
@@ -31,6 +44,10 @@ def main():
     if 'active_installation_sub_category' not in st.session_state: # New state for sub-category within Installation
         st.session_state.active_installation_sub_category = None
 
+    # Deep links (?page=user-manual&section=for-admins) render their page on
+    # the very first run
+    route_from_query_params()
+
 
     # Define main page categories (Installation Guide, User Manual, About)
     user_manual_options = {
@@ -46,17 +63,21 @@ def main():
     # --- Sidebar Navigation ---
     st.sidebar.title("Attendance System with Auto Report Guide & Manual")
 
+    show_search()
+
     # Installation Guide Dropdown (Main parent dropdown)
     with st.sidebar.expander("🛠️ Installation Guide"):
         if st.button("General Requirement", key="install_General Requirement_btn"):
             st.session_state.active_page_category = "Installation Guide"
             st.session_state.active_installation_sub_category = "General Requirement"
             st.session_state.active_sub_page = None # Reset sub_page for other categories
+            st.session_state.search_target = None
 
         if st.button("Required Library", key="install_requiredlibraries_btn"):
             st.session_state.active_page_category = "Installation Guide"
             st.session_state.active_installation_sub_category = "Required Library"
             st.session_state.active_sub_page = None # Reset sub_page for other categories
+            st.session_state.search_target = None
 
     # User Manual Dropdown
     with st.sidebar.expander("📖 User Manual"):
@@ -65,6 +86,11 @@ def main():
                 st.session_state.active_page_category = "User Manual"
                 st.session_state.active_sub_page = key
                 st.session_state.active_installation_sub_category = None # Reset for other categories
+                st.session_state.search_target = None
+
+    # Screenshots are only sent for the steps a reader actually opens
+    st.sidebar.toggle("Load screenshots on demand", value=True, key="lazy_screenshots",
+                      help="Show each step's screenshots only after you open that step.")
 
     # About Dropdown
     #with st.sidebar.expander("ℹ️ About"):
@@ -74,6 +100,9 @@ def main():
     #            st.session_state.active_sub_page = key
     #            st.session_state.active_installation_sub_category = None # Reset for other categories
 
+    # Keep the URL pointing at whatever is shown, so it can be shared/bookmarked
+    sync_query_params()
+
     # --- Display Content ---
     # With layout="centered" and the CSS, you don't need st.columns([1, 3, 1]) for centering.
     # The content will automatically be centered and constrained by the max-width.
@@ -88,474 +117,245 @@ def main():
         # Default view or initial message
         st.info("Welcome to the App Guide & Manual! Please select a section from the sidebar to begin.")
 
+    if metrics_enabled:
+        show_metrics_panel(render_metrics.finish(st.session_state, current_route()))
 
-def show_installation_guide(installation_sub_category=None):
-    st.title("🛠️ Installation Guide")
-    st.markdown("---")
-
-    if installation_sub_category == "General Requirement":
-        st.header("1. Prerequisites")
-        st.markdown("""
-        Before you begin, ensure you have the following installed:
-        * **Python:** Version 3.7 or higher but the highly recommended version is Pyhton 3.11 because the development of this project are using the 3.11. You can download it from [python.org](https://www.python.org/downloads/).
-        * **pip:** Python's package installer (usually comes with Python).
-        * **Git (Optional but Recommended):** For cloning the repository. Download from [git-scm.com](https://git-scm.com/downloads).
-        """)
-        st.markdown("---")
-
-        st.header("2. Setting up a Virtual Environment (Recommended)")
-        st.markdown("""
-        It's highly recommended to use a virtual environment to manage project dependencies.
-
-        **On Windows:**
-        ```bash
-        python -m venv venv
-        .\\venv\\Scripts\\activate
-        ```
-
-        **On macOS/Linux:**
-        ```bash
-        python3 -m venv venv
-        source venv/bin/activate
-        ```
-        You should see `(venv)` at the beginning of your terminal prompt.
-        """)
-        st.markdown("---")
-
-        st.header("3. Installing the Application")
-        st.subheader("Option A: Using pip (if your app is on PyPI)")
-        st.markdown("""
-        If your application is published on the Python Package Index (PyPI), users can install it directly using pip:
-        ```bash
-        pip install your-app-name
-        ```
-        *(Replace `your-app-name` with the actual name of your package on PyPI.)*
-        """)
-
-        st.subheader("Option B: From Source Code (e.g., GitHub)")
-        st.markdown("""
-        1.  **Clone the repository (if applicable):**
-            ```bash
-            git clone <your-repository-url>
-            cd <your-repository-directory>
-            ```
-            *(Replace `<your-repository-url>` and `<your-repository-directory>` with your actual repository details.)*
-
-        2.  **Install dependencies:**
-            Navigate to the project directory (where `requirements.txt` or `setup.py` is located).
-            ```bash
-            pip install -r requirements.txt
-            ```
-            *(Ensure you have a `requirements.txt` file listing all necessary packages, including `streamlit`.)*
-        """)
-        st.markdown("---")
-
-        st.header("4. Running the Application")
-        st.markdown("""
-        Once the installation is complete:
-        1.  Navigate to the main application directory in your terminal (if you cloned from source).
-        2.  Run the Streamlit app using the following command:
-            ```bash
-            streamlit run your_app_file.py
-            ```
-            *(Replace `your_app_file.py` with the actual name of your main Streamlit Python file.)*
-
-        3.  Your default web browser should automatically open to the application's URL (usually `http://localhost:8501`).
-        """)
-        st.markdown("---")
-
-        st.header("5. Troubleshooting (Example)")
-        st.markdown("""
-        * **ModuleNotFoundError:** If you see an error like `ModuleNotFoundError: No module named 'some_package'`, it means a required package is missing.
-            * **Solution:** Activate your virtual environment and install the missing package: `pip install some_package`. Then, try running the app again.
-        * **Streamlit command not found:**
-            * **Solution:** Ensure Streamlit is installed correctly and that its installation directory is in your system's PATH. If using a virtual environment, make sure it's activated.
-        """)
-
-
-    elif installation_sub_category == "Required Library":
-        st.header("Required Python Library")
-        st.subheader("1. Streamlit")
-        st.write("`Streamlit` – Used to create the web-based dashboard and user interface")
-        st.code("""pip install streamlit""")
-
-        st.markdown("---")
-
-        st.subheader("2. Face Recognition")
-        st.write("`face_recognition` – Used to detect and recognize faces from webcam or image")
-        st.code("""pip install face_recognition""") # Corrected: It was 'streamlit' again
-
-        st.write("🔧 Requires dependencies:")
-        st.code("""pip install cmake
-pip install dlib""")
-
-        st.subheader("If you're encountering issues installing the face_recognition library, particularly problems related to dlib compilation, you can try installing a precompiled dlib wheel file. This often bypasses the need for a C++ compiler and CMake.")
-        st.write("Here's how to do it:")
-        st.markdown("""
-        1.  Go to the Unofficial Dlib Precompiled Wheels Repository:     
-        Open your web browser and navigate to this link:     
-        https://github.com/Cfuhfsgh/Dlib-library-Installation
-        2.  Identify Your Python Version:   
-        You need to know your exact Python version. Open your terminal or command prompt and run:   
-            ```bash
-            python --version
-            ``` 
-            This will output something like `Python 3.8.10` or `Python 3.9.7`. Pay close attention to the minor version (e.g., `3.8`, `3.9`, `3.10`, etc.).
-
-        3.  Download the Correct `dlib` Wheel File:   
-        On the GitHub page, you'll see a list of `.whl` files. These are precompiled Python packages. 
-            - Look for a file that matches your Python version and your operating system (64-bit).   
-            - For example:   
-                - If you have Python 3.9 and a 64-bit Windows system, you might look for `dlib-19.xx.x-cp39-cp39m-win_amd64.whl`.
-                - If you have Python 3.11 and a 64-bit Windows system, you might look for `dlib-19.xx.x-cp311-cp311m-win_amd64.whl`.   
-                - Click on the `.whl` file that matches your system.   
-                - On the next page, click the "Download" button (usually a down-arrow icon) to save the file to your computer. Remember where you save it (e.g., your "Downloads" folder).   
-
-        4. Install the Downloaded `dlib` Wheel File:     
-        Find your Wheel File on your directory for example "Download" and then copy the name file. Use `pip` to install the `.whl` file. Replace `dlib-19.xx.x-cpXX-cpXXm-win_amd64.whl` with the actual name of the file you downloaded in your terminal:     
-            ```bash
-            pip install dlib-19.xx.x-cpXX-cpXXm-win_amd64.whl   
-            ``` 
-        (Example: `pip install dlib-19.22.99-cp39-cp39-win_amd64.whl`)     
-
-        5. Install `face_recognition`:   
-        After `dlib` is successfully installed, you can now reinstall `face_recognition`:   
-            ```bash 
-            pip install face_recognition     
-            ``` 
-        This approach should help resolve common dlib installation errors by providing a precompiled version, avoiding the need for local compilation.
-        """)
-
-        st.markdown("---")
-
-        st.subheader("3. Pandas")
-        st.write("`pandas` – Used to handle and organize tabular data (like attendance records)")
-        st.code("""pip install pandas""")
-
-        st.markdown("---")
-
-        st.subheader("4. Pickle")
-        st.write("`pickle – (Built-in)` Used to save/load face encodings into a file")
-        st.write("✅ No installation needed (built into Python)")
-
-        st.markdown("---")
-
-        st.subheader("5. io")
-        st.write("`io – (Built-in)` Used to handle in-memory file objects (for uploads, downloads)")
-        st.write("✅ No installation needed (built into Python)")
-
-        st.markdown("---")
-
-        st.subheader("6. DateTime")
-        st.write("`datetime – (Built-in)` Used to manage date and time (e.g. attendance timestamps)")
-        st.write("✅ No installation needed (built into Python)")
-
-        st.markdown("---")
-
-        st.subheader("7. gspread")
-        st.write("`gspread` – Connects to and edits Google Sheets from your app")
-        st.code("""pip install gspread""")
-
-        st.markdown("---")
-
-        st.subheader("8. Plotly")
-        st.write("`plotly` – Used for interactive charts (attendance visualizations, statistics)")
-        st.code("""pip install plotly""")
-
-        st.markdown("---")
-
-        st.subheader("9. Google Auth")
-        st.write("`google-auth` – Handles authentication to Google services")
-        st.code("""pip install google-auth""")
-
-        st.markdown("---")
-
-        st.subheader("10. Google Auth Oauthlib")
-        st.write("`google-auth-oauthlib` – Helps with Google OAuth2 authentication flows")
-        st.code("""pip install google-auth-oauthlib""")
-
-        st.markdown("---")
 
-        st.subheader("11. Google API Python Client")
-        st.write("`google-api-python-client` – Sends data to Google Sheets and uploads files to Google Drive")
-        st.code("""pip install google-api-python-client""")
-
-        st.markdown("---")
-
-        st.subheader("12. os")
-        st.write("`os – (Built-in)` Interacts with the file system (like checking files or paths)")
-        st.write("✅ No installation needed (built into Python)")
-
-        st.markdown("---")
-
-        st.subheader("13. Seaborn")
-        st.write("`seaborn` – Creates beautiful statistical charts (optional for data trends)")
-        st.code("""pip install seaborn""")
-
-        st.markdown("---")
-
-        st.subheader("14. MatPlotLib")
-        st.write("`matplotlib` – Used for plotting graphs and heatmaps (used by Seaborn too)")
-        st.code("""pip install matplotlib""")
-
-        st.markdown("---")
+def set_route(category, sub_page=None):
+    st.session_state.active_page_category = category
+    if category == "Installation Guide":
+        st.session_state.active_installation_sub_category = sub_page
+        st.session_state.active_sub_page = None
+    else:
+        st.session_state.active_sub_page = sub_page
+        st.session_state.active_installation_sub_category = None
+    st.session_state.search_target = None
 
-        st.subheader("15. Base64")
-        st.write("`base64` – (Built-in) Used to encode images for display or upload")
-        st.write("✅ No installation needed (built into Python)")
 
-        st.markdown("---")
+def active_sub_page():
+    if st.session_state.active_page_category == "Installation Guide":
+        return st.session_state.active_installation_sub_category
+    return st.session_state.active_sub_page
+
+
+def route_from_query_params():
+    # Only applied when the URL differs from the one this session last wrote:
+    # on the first run, or after back/forward or a pasted link. Otherwise a
+    # sidebar click or search hit made in this run would be undone.
+    requested = (st.query_params.get("page"), st.query_params.get("section"))
+    if requested == st.session_state.get("routed_query"):
+        return
+    st.session_state.routed_query = requested
+    route = manual_content.find_route(*requested)
+    if route is not None:
+        set_route(*route)
+
+
+def sync_query_params():
+    page, section = manual_content.route_slugs(st.session_state.active_page_category, active_sub_page())
+    for name, value in (("page", page), ("section", section)):
+        if value is None:
+            st.query_params.pop(name, None)
+        elif st.query_params.get(name) != value:
+            st.query_params[name] = value
+    st.session_state.routed_query = (page, section)
+
+
+def current_route():
+    category = st.session_state.active_page_category
+    if category is not None:
+        return f"{category}/{active_sub_page()}"
+    return "welcome"
+
+
+def show_metrics_panel(record):
+    with st.sidebar.expander("🐞 Render metrics"):
+        st.caption("This rerun")
+        st.json(record)
+        st.caption("Recent reruns in this process")
+        st.dataframe(render_metrics.summary(), hide_index=True)
+
+
+def get_page(category, sub_page=None):
+    # manual_content keeps every parsed content file for the whole process, so
+    # this is a stat per file unless someone edited the page since last time
+    return manual_content.build_page(category, sub_page)
+
+
+@st.cache_resource(max_entries=1, show_spinner=False)
+def get_search_index(revision):
+    # Shared by every session, and rebuilt only once the content has changed
+    return search_index.build_index(
+        (category, sub_page, get_page(category, sub_page))
+        for category, sub_page, _, _ in manual_content.ROUTES
+    )
 
-        st.subheader("16. MatPlotLib Colors")
-        st.write("`matplotlib.colors` – Provides color maps for heatmaps and visualizations")
-        st.write("✅ Already part of `matplotlib`")
 
-        st.markdown("---")
+def search_manual(query):
+    # Loading every page first picks up edits anywhere in the manual, which
+    # moves the revision on and so rebuilds the index
+    for category, sub_page, _, _ in manual_content.ROUTES:
+        get_page(category, sub_page)
+    return get_search_index(manual_content.revision()).search(query)
+
+
+@st.cache_resource(ttl=600, show_spinner=False)
+def get_installed_versions(libraries):
+    # Metadata only, so this is cheap; the TTL picks up a `pip install` soon after
+    return dependency_check.check_versions(libraries)
+
+
+@st.cache_resource(show_spinner="Timing each import in a fresh interpreter...")
+def get_import_times(libraries):
+    # Shared by every session: one measurement per process is enough for sizing
+    return dependency_check.import_times(libraries, get_installed_versions(libraries))
+
+
+def clear_dependency_check():
+    get_installed_versions.clear()
+    get_import_times.clear()
+
+
+def show_dependency_check(libraries):
+    # The check describes the server's own environment, not the reader's, so
+    # it is for operators only. Timing imports spawns an interpreter per
+    # library on the shared host, so only MANUAL_METRICS=1 unlocks it;
+    # ?debug=dependencies shows the read-only version table.
+    operator = render_metrics.env_enabled()
+    if not (operator or st.query_params.get("debug") == "dependencies"):
+        return
+    versions = get_installed_versions(libraries)
+    st.caption(f"Environment of this server: Python at `{sys.executable}`")
+    render_metrics.count_element()
+    times = None
+    if operator:
+        measure = st.toggle("Measure import times", key="measure_import_times")
+        render_metrics.count_element()
+        times = get_import_times(libraries) if measure else None
+    # A markdown table rather than st.dataframe, which would pull in pandas
+    lines = ["| Library | Status | Version | Import (ms) |" if times else "| Library | Status | Version |",
+             "|---|---|---|---:|" if times else "|---|---|---|"]
+    for row in dependency_check.report_rows(libraries, versions, times):
+        cells = [f"`{row['library']}`", row["status"], row["version"] or f"`{row['install']}`"]
+        if times:
+            cells.append("" if row["import_ms"] is None else f"{row['import_ms']:.1f}")
+        lines.append("| " + " | ".join(cells) + " |")
+    st.markdown("\n".join(lines))
+    render_metrics.count_element()
+    missing = [name for name, version in versions.items() if not version]
+    if missing:
+        st.caption(f"Missing: {', '.join(missing)}")
+        render_metrics.count_element()
+    if times:
+        slowest = sorted(((ms, name) for name, ms in times.items() if ms is not None), reverse=True)[:3]
+        st.caption("Slowest imports: " + ", ".join(f"{name} ({ms:.0f} ms)" for ms, name in slowest))
+        render_metrics.count_element()
+    if operator:
+        st.button("🔄 Check again", key="recheck_dependencies", on_click=clear_dependency_check)
+        render_metrics.count_element()
+
+
+def open_search_hit(doc):
+    set_route(doc.category, doc.sub_page)
+    st.session_state.search_target = (doc.category, doc.sub_page, doc.section, doc.heading)
+    # Open the matching step straight away when screenshots load on demand;
+    # only sections with screenshots have a step expander to open
+    section = next((block for block in get_page(doc.category, doc.sub_page)
+                    if block.kind == "section" and block.key == doc.section), None)
+    if section is not None and section.has_images:
+        st.session_state[f"step_{doc.section}"] = True
+
+
+def show_search():
+    query = st.sidebar.text_input("🔍 Search the manual", key="search_query",
+                                  placeholder="e.g. dlib wheel, date range")
+    if not query.strip():
+        return
+    hits = search_manual(query)
+    if not hits:
+        st.sidebar.caption("No matches.")
+    for i, (_, doc) in enumerate(hits):
+        label = doc.heading if doc.heading == doc.sub_page else f"{doc.heading} · {doc.sub_page}"
+        st.sidebar.button(label, key=f"search_hit_{i}", on_click=open_search_hit, args=(doc,))
+        st.sidebar.caption(search_index.snippet(doc.text, query))
+
+
+def show_search_target(category, sub_page):
+    # After jumping from a search result, point at the matching section
+    target = st.session_state.get("search_target")
+    if target and target[:2] == (category, sub_page) and target[2] is not None:
+        st.info(f"Search result: **{target[3]}** — [jump to section](#{target[2]})")
+        render_metrics.count_element()
+
+
+def render_blocks(blocks, placeholders=False):
+    for block in blocks:
+        render_block(block, placeholders)
+
+
+def render_block(block, placeholders=False):
+    if block.kind == "section":
+        render_section(block, placeholders)
+    elif block.kind == "image":
+        if image_assets.IMAGE_MODE == "static":
+            # Browser fetches a cacheable URL; 2x WebP so HiDPI screens stay sharp
+            if placeholders:
+                src = image_assets.url(block.body, image_assets.PLACEHOLDER_WIDTH, "JPEG")
+            else:
+                src = image_assets.url(block.body, block.width * 2)
+            st.image(src, width=block.width)
+            render_metrics.count_image(0)
+        else:
+            if placeholders:
+                data = image_assets.placeholder(block.body, block.width)
+            else:
+                data = image_assets.load(block.body, block.width)
+            st.image(data, width=block.width)
+            render_metrics.count_image(len(data))
+    elif block.kind == "dependency_check":
+        show_dependency_check(block.body)
+    else:
+        getattr(st, block.kind)(block.body)
+        render_metrics.count_element()
+
+
+def render_section(section, placeholders=False):
+    # The heading is anchored on the section key so links and search results
+    # can point straight at it
+    heading = section.heading
+    body = section.children
+    if heading is not None:
+        getattr(st, heading.kind)(heading.body, anchor=section.key)
+        render_metrics.count_element()
+        body = body[1:]
+
+    if section.has_images and st.session_state.get("lazy_screenshots", True):
+        # The step's text and screenshots sit in an expander. Opening it
+        # triggers a rerun, and only then are the full images sent - until
+        # that point each one is a tiny blurred placeholder.
+        render_metrics.count_element()
+        with st.expander("📷 Steps and screenshots", key=f"step_{section.key}", on_change="rerun") as step:
+            render_blocks(body, placeholders=not step.open)
+    else:
+        render_blocks(body, placeholders)
 
 
-    else:
-        st.info("Please select either 'General Requirement' or 'Required Library' from the 'Installation Guide' dropdown.")
+@render_metrics.timed
+def show_installation_guide(installation_sub_category=None):
+    show_search_target("Installation Guide", installation_sub_category)
+    render_blocks(get_page("Installation Guide", installation_sub_category))
 
 
+@render_metrics.timed
 def show_user_manual(sub_page=None):
-    st.title("📖 User Manual")
-    st.markdown("---")
-    
-    if sub_page == "For Students":
-        st.header("🧑‍🎓 For Students")
-        st.subheader("1. 🧑‍🎓 Register Face")            
-        st.markdown("""
-        Steps:
-
-        i) Go to the "Register Face" tab.
-        """)
-        st.image("images/register face.jpg", width=700)
-
-        st.markdown("""
-        ii) Fill in:
-        - Full Name
-        - Student ID
-        - Email
-        - Phone Number
-        """)
-        st.image("images/fill in.jpg", width=700)
-
-        st.markdown("""
-        iii) Capture your face using the camera.
-        """)
-        st.image("images/capture face.jpg", width=700)
-
-        st.markdown("""iv) Click "Register".""")
-
-
-
-        st.markdown("""         
-        ✅ If registration is successful, your face and info will be saved.
-        """)
-        #st.image("")
-
-        st.markdown("""
-        ⚠️ Errors:
-
-        - Invalid email or phone number.
-        - No face detected.
-        - Missing fields.
-        """)
-        #st.image("")
-
-        st.markdown("---")
-
-        st.subheader("2. 📝 Submit Attendance")
-        st.markdown("""
-        Steps:
-
-        i) Go to the "Submit Attendance" tab.
-        """)
-        st.image("images/submit attendance.jpg", width=700)
-
-        st.markdown("""
-        ii) Select your class from the dropdown.
-        """)
-        st.image("images/select class.jpg", width=700)
-
-        st.markdown("""
-        iii) Capture your face using the camera.
-        """)
-        st.image("images/capture face submit.jpg", width=700)
-            
-        st.markdown("""
-        ✅ If your face is recognized:
-
-        - Attendance will be recorded.
-        - Image will be uploaded to Google Drive.
-        - Your name, student ID, class, and timestamp will be saved in Google Sheets.
-        """)
-        #st.image("")
-            
-        st.markdown("""
-        ❌ If not recognized, you’ll see an error message.
-        """)
-        #st.image("")
-
-        st.markdown("---")
-
-        st.subheader("3. 📈 View Student Performance")
-        st.markdown("""
-        Steps:
-
-        i) Go to the "Student Performance" tab.
-        """)
-        st.image("images/student performance.jpg", width=700)
-            
-        st.markdown("""
-        ii) Select your class.
-        """)
-        st.image("images/select class performance.jpg", width=700)
-            
-        st.markdown("""
-        iii) Choose your name + student ID.
-        """)
-        st.image("images/select student.jpg", width=700)
-
-        st.markdown("""
-        iv) View:
-
-        - Total days attended.   
-        - Attendance rate (%).   
-        - Class average comparison.   
-        - Attendance over time (line chart).
-        """)
-
-        st.markdown("""
-        v) Download your CSV attendance report.
-
-        ⚠️ If attendance is < 75%, you'll see a warning.
-        """)
-        st.image("images/view performance.jpg", width=700)
-
-    elif sub_page == "For Admins":
-        st.header("2. 🛠️ For Admins")
-        st.subheader("Login:")
-        st.markdown("""
-        1. Go to the "Admin Panel" tab.
-        """)
-        st.image("images/admin panel.jpg", width=700)
-
-        st.markdown("""
-        2. Enter the admin code: admin123.
-        """)
-        st.image("images/admin login.jpg", width=700)
-
-        st.markdown("---")
-
-        st.subheader("🔧 Admin Features")
-        st.markdown("""
-        ➕ Add New Class
-        - Type a new class name.
-        - Click "Add Class" to create a Drive folder and track attendance.
-        """)
-        st.image("images/add class.jpg", width=700)
-        
-        st.markdown("""
-        ➖ Remove Class
-        - Select an existing class to remove from the system.
-        - WARNING: This action cannot be undone.
-        """)
-        st.image("images/remove class.jpg", width=700)
-
-        st.markdown("---")
-
-        st.subheader("📊 Attendance Dashboard")
-        st.markdown("""
-        a) Select a class.
-
-        b) Pick a date range.
-        """)
-        st.image("images/attendance dashboard.jpg", width=700)
-        
-        st.markdown("""
-        c) View:
-
-        - Average attendance.
-        - Low attendance students.
-        - Top 3 attendees.
-        - Attendance pie chart.
-        """)
-        st.image("images/attendance dashboard2.jpg", width=700)
-        st.image("images/attendance dashboard3.jpg", width=700)
-
-        st.markdown("---")
-
-        st.subheader("📥 Download Attendance Data")
-        st.markdown("""
-        - Select a class.
-        - Choose a date range.
-        - Click "Download CSV" to export data.
-        """)
-        st.image("images/download attendance data.jpg", width=700)
-
-        st.markdown("---")
-
-        st.subheader("💾 Data Storage")
-
-        data_storage = {
-        "Component": [
-        "Registered Faces",
-        "Class Folder IDs",
-        "Attendance Records",
-        "Face Images"
-        ],
-        "Location": [
-        "known_faces.pkl (local file)",
-        "class_folders.pkl",
-        "Google Sheets",
-        "Google Drive (per class folder)"
-        ]
-        }
-        df_storage = pd.DataFrame(data_storage)
-        
-        st.table(df_storage)
-
-    else:
-        st.info("Please select a specific section from the 'User Manual' dropdown to view its content.")
+    show_search_target("User Manual", sub_page)
+    render_blocks(get_page("User Manual", sub_page))
 
 
+@render_metrics.timed
 def show_about_page(sub_page=None):
-    st.title("ℹ️ About This Application")
-    st.markdown("---")
-
-    if sub_page == "App Info":
-        st.markdown("""
-        **[Your App Name]**
-        Version: [Your App Version, e.g., 1.0.0]
-        Last Updated: [Date of Last Update, e.g., May 2024]
-
-        **Developed by:**
-        [Your Name / Your Team's Name]
-
-        **Contact / Support:**
-        If you encounter any issues or have questions, please [Provide contact method, e.g., 'email support@example.com' or 'open an issue on our GitHub repository: <link-to-github-issues>'].
-
-        **Purpose:**
-        [Reiterate the main purpose of your application in a sentence or two.]
-
-        **Technology Stack:**
-        * Python
-        * Streamlit
-        * [List other key libraries or technologies used, e.g., Pandas, NumPy, Scikit-learn, etc.]
-        """)
-    elif sub_page == "Contact":
-        st.header("Contact / Support")
-        st.markdown("""
-        If you encounter any issues or have questions, please [Provide contact method, e.g., 'email support@example.com' or 'open an issue on our GitHub repository: <link-to-github-issues>'].
-        """)
-    else:
-        st.info("Please select a specific section from the 'About' dropdown to view its content.")
-
-    st.markdown("---")
-    st.markdown("""
-    *[Optional: Add a license section if your app is open source, e.g., 'This application is licensed under the MIT License.']*
-    """)
+    show_search_target("About", sub_page)
+    render_blocks(get_page("About", sub_page))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,159 @@
+"""Opt-in per-rerun instrumentation for the manual app.
+
+Turn it on with the ``MANUAL_METRICS=1`` environment variable (every session)
+or by adding ``?debug=metrics`` to the URL (that session only). Each rerun then
+records, for the route being shown:
+
+* wall time of each timed ``show_*`` function and of the whole rerun,
+* the number of Streamlit elements the page renderer emitted,
+* bytes of image data handed to ``st.image``,
+* the pickled size of the session state.
+
+Every record is written as one JSON line to the ``manualapp.metrics`` logger
+(stderr), and appended to ``MANUAL_METRICS_FILE`` when that is set, so it can be
+scraped. The app also shows the latest record and per-route aggregates in a
+debug panel.
+"""
+import contextvars
+import functools
+import json
+import logging
+import os
+import pickle
+import sys
+import threading
+import time
+from collections import deque
+
+ENV_FLAG = "MANUAL_METRICS"
+ENV_FILE = "MANUAL_METRICS_FILE"
+
+# Records kept per route for the aggregates in the debug panel.
+HISTORY_SIZE = 200
+
+logger = logging.getLogger("manualapp.metrics")
+
+_current = contextvars.ContextVar("render_metrics", default=None)
+_history = {}
+_history_lock = threading.Lock()
+
+
+def env_enabled():
+    return os.environ.get(ENV_FLAG, "").lower() in ("1", "true", "yes", "on")
+
+
+class RerunMetrics:
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.timings = {}
+        self.elements = 0
+        self.image_bytes = 0
+        self.images = 0
+
+    def as_dict(self, route, session_state_bytes, total_ms):
+        return {
+            "ts": round(time.time(), 3),
+            "route": route,
+            "total_ms": round(total_ms, 3),
+            "timings_ms": {name: round(ms, 3) for name, ms in self.timings.items()},
+            "elements": self.elements,
+            "images": self.images,
+            "image_bytes": self.image_bytes,
+            "session_state_bytes": session_state_bytes,
+        }
+
+
+def begin():
+    """Start recording a rerun in the current script thread."""
+    _current.set(RerunMetrics())
+
+
+def count_element(n=1):
+    metrics = _current.get()
+    if metrics is not None:
+        metrics.elements += n
+
+
+def count_image(nbytes):
+    """Count an image element and the bytes pushed for it (0 for URLs)."""
+    metrics = _current.get()
+    if metrics is not None:
+        metrics.elements += 1
+        metrics.images += 1
+        metrics.image_bytes += nbytes
+
+
+def timed(func):
+    """Decorator recording the wall time of ``func`` in the current rerun."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        metrics = _current.get()
+        if metrics is None:
+            return func(*args, **kwargs)
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = (time.perf_counter() - start) * 1000
+            metrics.timings[func.__name__] = metrics.timings.get(func.__name__, 0) + elapsed
+    return wrapper
+
+
+def session_state_size(state):
+    """Approximate size of a session state mapping, in pickled bytes."""
+    total = 0
+    for key in list(state.keys()):
+        try:
+            value = state[key]
+            total += len(pickle.dumps((key, value), protocol=pickle.HIGHEST_PROTOCOL))
+        except Exception:
+            total += sys.getsizeof(key) + sys.getsizeof(state.get(key))
+    return total
+
+
+def finish(state, route):
+    """Close the current rerun's record for ``route``, emit it and return it."""
+    metrics = _current.get()
+    if metrics is None:
+        return None
+    _current.set(None)
+    total_ms = (time.perf_counter() - metrics.started) * 1000
+    record = metrics.as_dict(route, session_state_size(state), total_ms)
+
+    with _history_lock:
+        _history.setdefault(route, deque(maxlen=HISTORY_SIZE)).append(record)
+
+    line = json.dumps(record, ensure_ascii=False)
+    logger.info(line)
+    path = os.environ.get(ENV_FILE)
+    if path:
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+    return record
+
+
+def summary():
+    """Per-route aggregates over the recent history of this process."""
+    with _history_lock:
+        snapshot = {route: list(records) for route, records in _history.items()}
+    rows = []
+    for route, records in sorted(snapshot.items()):
+        totals = sorted(r["total_ms"] for r in records)
+        rows.append({
+            "route": route,
+            "reruns": len(records),
+            "mean_ms": round(sum(totals) / len(totals), 2),
+            "p95_ms": round(totals[min(len(totals) - 1, int(len(totals) * 0.95))], 2),
+            "max_elements": max(r["elements"] for r in records),
+            "max_image_bytes": max(r["image_bytes"] for r in records),
+        })
+    return rows
+
+
+if not logger.handlers:
+    # Streamlit only configures its own loggers, so give ours a plain handler
+    _handler = logging.StreamHandler()
+    _handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(_handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
@@ -0,0 +1,137 @@
+"""Full-text search over the manual.
+
+The index is built once from the same block trees the app renders. Each
+section (or the loose blocks of a page that sit outside any section) is one
+searchable document, so a hit can point straight at the right page and
+section. Postings are plain dicts of precomputed weights, so a lookup is a
+handful of dictionary reads.
+"""
+import bisect
+import math
+import re
+from dataclasses import dataclass
+
+TOKEN_RE = re.compile(r"[a-z0-9]+(?:[._-][a-z0-9]+)*")
+
+# Terms found in a heading count this many times over body text.
+HEADING_BOOST = 3
+
+
+@dataclass(frozen=True)
+class Document:
+    category: str
+    sub_page: str
+    section: str  # section key, or None for blocks outside any section
+    heading: str
+    text: str
+
+
+def tokenize(text):
+    """Lowercase terms; dotted/underscored names also yield their parts."""
+    terms = []
+    for token in TOKEN_RE.findall(text.lower()):
+        terms.append(token)
+        parts = re.split(r"[._-]", token)
+        if len(parts) > 1:
+            terms.extend(parts)
+    return terms
+
+
+def _block_text(block):
+    if block.kind == "section":
+        return " ".join(_block_text(child) for child in block.children)
+    if block.kind == "table":
+        return " ".join(str(value) for value in block.body.to_numpy().ravel())
+    if block.kind == "image":
+        return ""
+    if block.kind == "dependency_check":
+        return " ".join(library.name for library in block.body)
+    return str(block.body)
+
+
+def _documents(category, sub_page, blocks):
+    loose = []
+    for block in blocks:
+        if block.kind == "section":
+            heading = block.heading
+            yield Document(category, sub_page, block.key,
+                           heading.body if heading is not None else sub_page,
+                           _block_text(block))
+        else:
+            loose.append(_block_text(block))
+    if loose:
+        yield Document(category, sub_page, None, sub_page, " ".join(loose))
+
+
+class SearchIndex:
+    def __init__(self, documents):
+        self.documents = list(documents)
+        counts = {}
+        for doc_id, doc in enumerate(self.documents):
+            for term in tokenize(doc.heading) * HEADING_BOOST + tokenize(doc.text):
+                counts.setdefault(term, {})
+                counts[term][doc_id] = counts[term].get(doc_id, 0) + 1
+
+        # tf-idf weights, with term frequency damped so long sections do not
+        # win just by repeating a word
+        total = len(self.documents)
+        self.postings = {
+            term: {doc_id: (1 + math.log(tf)) * math.log(1 + total / len(docs))
+                   for doc_id, tf in docs.items()}
+            for term, docs in counts.items()
+        }
+        self.vocabulary = sorted(self.postings)
+
+    def _expand(self, term):
+        """Terms starting with ``term``, so partially typed words still match."""
+        start = bisect.bisect_left(self.vocabulary, term)
+        matches = []
+        for candidate in self.vocabulary[start:]:
+            if not candidate.startswith(term):
+                break
+            matches.append(candidate)
+        return matches
+
+    def search(self, query, limit=8):
+        """Return up to ``limit`` (score, Document) pairs, best first.
+
+        Every query term must match; the last one may be a prefix.
+        """
+        terms = list(dict.fromkeys(TOKEN_RE.findall(query.lower())))
+        if not terms:
+            return []
+        scores = None
+        for i, term in enumerate(terms):
+            candidates = self._expand(term) if i == len(terms) - 1 else [term]
+            term_scores = {}
+            for candidate in candidates:
+                for doc_id, weight in self.postings.get(candidate, {}).items():
+                    term_scores[doc_id] = max(term_scores.get(doc_id, 0), weight)
+            if scores is None:
+                scores = term_scores
+            else:
+                scores = {doc_id: score + term_scores[doc_id]
+                          for doc_id, score in scores.items() if doc_id in term_scores}
+            if not scores:
+                return []
+        ranked = sorted(scores.items(), key=lambda item: -item[1])[:limit]
+        return [(score, self.documents[doc_id]) for doc_id, score in ranked]
+
+
+def build_index(pages):
+    """Build an index from ``(category, sub_page, blocks)`` triples."""
+    documents = []
+    for category, sub_page, blocks in pages:
+        documents.extend(_documents(category, sub_page, blocks))
+    return SearchIndex(documents)
+
+
+def snippet(text, query, width=80):
+    """A short excerpt of ``text`` around the first query term it contains."""
+    flat = " ".join(text.split())
+    lowered = flat.lower()
+    positions = [lowered.find(term) for term in TOKEN_RE.findall(query.lower())]
+    positions = [pos for pos in positions if pos >= 0]
+    start = max(min(positions) - width // 3, 0) if positions else 0
+    excerpt = flat[start:start + width]
+    return ("…" if start else "") + excerpt + ("…" if start + width < len(flat) else "")
@@ -0,0 +1,42 @@
+"""Which output directories export_static is allowed to replace."""
+import pytest
+
+import export_static
+import manual_content
+
+pytest.importorskip("markdown_it")
+
+
+@pytest.fixture(autouse=True)
+def no_routes(monkeypatch):
+    # The landing page alone is enough to exercise the swap
+    monkeypatch.setattr(manual_content, "ROUTES", [])
+
+
+def test_refuses_non_empty_unmarked_directory(tmp_path):
+    out = tmp_path / "docs"
+    out.mkdir()
+    (out / "notes.txt").write_text("keep me", encoding="utf-8")
+    with pytest.raises(SystemExit):
+        export_static.export(str(out))
+    assert (out / "notes.txt").read_text(encoding="utf-8") == "keep me"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["docs"]
+
+
+def test_refuses_plain_file(tmp_path):
+    out = tmp_path / "site"
+    out.write_text("not a site", encoding="utf-8")
+    with pytest.raises(SystemExit):
+        export_static.export(str(out))
+    assert out.read_text(encoding="utf-8") == "not a site"
+
+
+def test_replaces_earlier_export(tmp_path):
+    out = tmp_path / "site"
+    export_static.export(str(out))
+    (out / "stale.html").write_text("old", encoding="utf-8")
+    export_static.export(str(out))
+    assert (out / export_static.EXPORT_MARKER).is_file()
+    assert (out / "index.html").is_file()
+    assert not (out / "stale.html").exists()
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["site"]
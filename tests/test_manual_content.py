@@ -0,0 +1,122 @@
+"""Content loading and hot reload in manual_content."""
+import os
+
+import pytest
+
+import manual_content
+
+CATEGORY = """
+[[before]]
+title = "About"
+
+[[landing]]
+info = "Pick a page."
+"""
+
+PAGE = """
+sections = ["intro"]
+
+[[blocks]]
+header = "App Info"
+"""
+
+INTRO = """
+[[blocks]]
+subheader = "Intro"
+
+[[blocks]]
+markdown = "{text}"
+"""
+
+
+def write(path, text):
+    path.write_text(text, encoding="utf-8")
+    # Make every write look like a new edit, however fast the test runs
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def content(tmp_path, monkeypatch):
+    monkeypatch.setattr(manual_content, "CONTENT_DIR", str(tmp_path))
+    monkeypatch.setattr(manual_content, "_files", {})
+    page_dir = tmp_path / "about" / "app-info"
+    page_dir.mkdir(parents=True)
+    write(tmp_path / "about" / "_category.toml", CATEGORY)
+    write(page_dir / "_page.toml", PAGE)
+    write(page_dir / "intro.toml", INTRO.format(text="first"))
+    return page_dir
+
+
+def section_text(blocks, key):
+    section = next(block for block in blocks if block.kind == "section" and block.key == key)
+    return section.children[1].body
+
+
+def test_builds_page_from_files(content):
+    blocks = manual_content.build_page("About", "App Info")
+    assert [block.kind for block in blocks] == ["title", "header", "section"]
+    assert section_text(blocks, "intro") == "first"
+    assert manual_content.build_page("About")[1].body == "Pick a page."
+
+
+def test_unchanged_files_are_not_parsed_again(content):
+    manual_content.build_page("About", "App Info")
+    revision = manual_content.revision()
+    manual_content.build_page("About", "App Info")
+    assert manual_content.revision() == revision
+
+
+def test_edit_reparses_only_that_file(content):
+    manual_content.build_page("About", "App Info")
+    revision = manual_content.revision()
+    write(content / "intro.toml", INTRO.format(text="second"))
+    assert section_text(manual_content.build_page("About", "App Info"), "intro") == "second"
+    assert manual_content.revision() == revision + 1
+
+
+def test_broken_edit_keeps_previous_version(content):
+    manual_content.build_page("About", "App Info")
+    write(content / "intro.toml", "[[blocks\n")
+    assert section_text(manual_content.build_page("About", "App Info"), "intro") == "first"
+
+
+def test_missing_file_keeps_previous_version(content):
+    manual_content.build_page("About", "App Info")
+    os.rename(content / "intro.toml", content / "intro.toml.swp")
+    assert section_text(manual_content.build_page("About", "App Info"), "intro") == "first"
+
+
+def test_section_listed_before_its_file_exists_is_left_out(content):
+    write(content / "_page.toml", PAGE.replace('["intro"]', '["intro", "new"]'))
+    blocks = manual_content.build_page("About", "App Info")
+    assert [block.key for block in blocks if block.kind == "section"] == ["intro"]
+
+
+def test_broken_file_without_previous_version_raises(content):
+    write(content / "_page.toml", "sections = [\n")
+    with pytest.raises(ValueError):
+        manual_content.build_page("About", "App Info")
+
+
+def test_shipped_content_builds_every_route():
+    for category, sub_page, _, _ in manual_content.ROUTES:
+        assert manual_content.build_page(category, sub_page)
+
+
+@pytest.mark.parametrize("route", manual_content.ROUTES, ids=lambda route: f"{route[2]}/{route[3]}")
+def test_route_slugs_round_trip(route):
+    category, sub_page, _, _ = route
+    assert manual_content.find_route(*manual_content.route_slugs(category, sub_page)) == (category, sub_page)
+
+
+def test_page_slug_without_section_is_landing_view():
+    category, _, page, _ = manual_content.ROUTES[0]
+    assert manual_content.find_route(page) == (category, None)
+    assert manual_content.route_slugs(category) == (page, None)
+
+
+@pytest.mark.parametrize("slugs", [("no-such-page",), ("no-such-page", "x"),
+                                   (manual_content.ROUTES[0][2], "no-such-section")])
+def test_unknown_slugs_give_none(slugs):
+    assert manual_content.find_route(*slugs) is None
@@ -0,0 +1,60 @@
+"""Ranking and matching in search_index, over a small hand-built manual."""
+import pytest
+
+from manual_content import Block
+from search_index import build_index
+
+
+def section(key, heading, *texts):
+    children = (Block("subheader", heading),) + tuple(Block("markdown", text) for text in texts)
+    return Block("section", key=key, children=children)
+
+
+PAGES = [
+    ("Installation Guide", "Required Library", (
+        Block("title", "Required Library"),
+        section("face-recognition", "Installing face_recognition",
+                "face_recognition needs dlib. On Windows, download the dlib wheel "
+                "that matches your Python version and install it with pip."),
+        section("opencv", "Installing OpenCV",
+                "Install opencv-python with pip. It does not need a wheel from elsewhere."),
+    )),
+    ("User Manual", "For Admins", (
+        section("dashboard", "Attendance Dashboard",
+                "Filter the attendance records by class and by date range, then "
+                "read the summary chart."),
+        section("download", "Download Attendance Data",
+                "Pick a date and download the attendance data as a CSV file."),
+    )),
+]
+
+
+@pytest.fixture(scope="module")
+def index():
+    return build_index(PAGES)
+
+
+@pytest.mark.parametrize("query, section", [
+    ("dlib wheel", "face-recognition"),
+    ("date range", "dashboard"),
+    ("download csv", "download"),
+    ("opencv", "opencv"),
+])
+def test_best_section_ranks_first(index, query, section):
+    hits = index.search(query)
+    assert hits
+    assert hits[0][1].section == section
+
+
+def test_partly_typed_last_word_matches(index):
+    hits = index.search("dlib whe")
+    assert [doc.section for _, doc in hits] == ["face-recognition"]
+
+
+def test_only_last_word_is_a_prefix(index):
+    assert index.search("dli wheel") == []
+
+
+def test_missing_term_returns_nothing(index):
+    assert index.search("dlib spreadsheet") == []
+    assert index.search("") == []